@@ -1,5 +1,8 @@
+from collections import OrderedDict
+
 from django.http import Http404
 
+from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
 
 from pandas_drf_tools import mixins
@@ -20,9 +23,19 @@ class GenericDataFrameAPIView(APIView):
     # For more complex lookup requirements override `get_object()`.
     lookup_url_kwarg = 'index'
 
+    # The query parameter used to request several rows at once, eg. `?ids=1,2,3`.
+    lookup_multiple_query_param = 'ids'
+
     # The style to use for dataframe pagination.
     pagination_class = None
 
+    # Set to a `DataFrameChangeJournal` instance to keep track of the rows changed
+    # by write operations, so clients can fetch only the rows that changed.
+    change_journal = None
+
+    # The query parameter holding the version clients want the changes since.
+    changes_since_query_param = 'since'
+
     def get_dataframe(self):
         """
         Get the DataFrame for this view.
@@ -52,11 +65,108 @@ class GenericDataFrameAPIView(APIView):
         """
         return dataframe
 
+    def coerce_index_keys(self, dataframe, keys):
+        """
+        Converts the given keys (usually strings taken from the URL, or JSON
+        values taken from a request body) to the type of the dataframe index
+        labels. Integer, float and string indexes are supported, any other
+        index gets the keys unchanged. Raises `ValueError` if a key can't be
+        converted.
+
+        Note that the default router lookup regex (`[^/.]+`) doesn't match
+        float keys like `2.5`, so views with float indexes need to set
+        `lookup_value_regex` to be able to retrieve single rows.
+        """
+        index = dataframe.index
+        kind = index.dtype.kind
+        if kind in 'iu':
+            return [int(key) for key in keys]
+        if kind == 'f':
+            return [float(key) for key in keys]
+        if index.inferred_type == 'string':
+            return [str(key) for key in keys]
+        return list(keys)
+
+    def get_index_positions(self, dataframe, keys):
+        """
+        Returns the positions of the rows matching the given keys, skipping
+        the ones that are not present and the repeated ones. The lookup is
+        done by the hash table pandas builds for the index, which is computed
+        once and cached on the index object, so fetching several rows costs a
+        single vectorized pass.
+        """
+        keys = list(OrderedDict.fromkeys(self.coerce_index_keys(dataframe, keys)))
+        positions = dataframe.index.get_indexer_for(keys)
+        return positions[positions != -1]
+
+    def get_change_journal(self):
+        """
+        Get the change journal for this view, or `None` if changes are not
+        being tracked. Defaults to using `self.change_journal`.
+        """
+        return self.change_journal
+
+    def record_dataframe_change(self, operation, index):
+        """
+        Records that `operation` was applied to the rows with the given index,
+        if the view is tracking changes.
+        """
+        journal = self.get_change_journal()
+        if journal is not None:
+            journal.record(operation, index.tolist())
+
     def index_row(self, dataframe):
         """
         Indexes the row based on the request parameters.
         """
-        return dataframe.loc[self.kwargs[self.lookup_url_kwarg]].to_frame().T
+        positions = self.get_index_positions(dataframe, [self.kwargs[self.lookup_url_kwarg]])
+        if not len(positions):
+            raise KeyError(self.kwargs[self.lookup_url_kwarg])
+        return dataframe.take(positions)
+
+    def get_multiple_keys(self, request):
+        """
+        Returns the list of keys requested for a multiple row lookup. Keys are
+        taken from a comma separated query parameter (eg. `?ids=1,2,3`) or,
+        for POST requests, from the body as a list or as a dict with the same
+        key as the query parameter.
+        """
+        if request.method == 'POST':
+            data = request.data
+            if isinstance(data, dict):
+                data = data.get(self.lookup_multiple_query_param, [])
+            if not isinstance(data, (list, tuple)):
+                raise ValidationError({
+                    self.lookup_multiple_query_param: ['Expected a list of keys.']
+                })
+            return list(data)
+
+        value = request.query_params.get(self.lookup_multiple_query_param, '')
+        return [key.strip() for key in value.split(',') if key.strip()]
+
+    def index_rows(self, dataframe):
+        """
+        Indexes the rows based on the request parameters. Keys that are not
+        present on the dataframe are ignored.
+        """
+        keys = self.get_multiple_keys(self.request)
+        try:
+            positions = self.get_index_positions(dataframe, keys)
+        except (TypeError, ValueError) as e:
+            raise ValidationError({self.lookup_multiple_query_param: [str(e)]})
+        return dataframe.take(positions)
+
+    def get_objects(self):
+        """
+        Returns the rows the view is displaying on multiple row lookups.
+        """
+        dataframe = self.filter_dataframe(self.get_dataframe())
+        obj = self.index_rows(dataframe)
+
+        # May raise a permission denied
+        self.check_object_permissions(self.request, obj)
+
+        return obj
 
     def get_object(self):
         """
@@ -186,6 +296,27 @@ class RetrieveAPIView(mixins.RetrieveDataFrameMixin,
         return self.retrieve(request, *args, **kwargs)
 
 
+class RetrieveMultipleAPIView(mixins.RetrieveMultipleDataFrameMixin,
+                              GenericDataFrameAPIView):
+    """
+    Concrete view for retrieving several rows at once.
+    """
+    def get(self, request, *args, **kwargs):
+        return self.retrieve_multiple(request, *args, **kwargs)
+
+    def post(self, request, *args, **kwargs):
+        return self.retrieve_multiple(request, *args, **kwargs)
+
+
+class ChangesAPIView(mixins.ChangesDataFrameMixin,
+                     GenericDataFrameAPIView):
+    """
+    Concrete view for listing the rows changed since a given version.
+    """
+    def get(self, request, *args, **kwargs):
+        return self.changes(request, *args, **kwargs)
+
+
 class DestroyAPIView(mixins.DestroyDataFrameMixin,
                      GenericDataFrameAPIView):
     """
@@ -0,0 +1,84 @@
+"""
+Bounded change journal used to let clients synchronize a dataframe by
+fetching only the rows that changed since a given version.
+"""
+from __future__ import unicode_literals
+
+from collections import OrderedDict, deque, namedtuple
+from threading import Lock
+from uuid import uuid4
+
+
+DataFrameChanges = namedtuple('DataFrameChanges',
+                              ['epoch', 'version', 'full_resync', 'upserted', 'deleted'])
+
+
+class DataFrameChangeJournal(object):
+    """
+    Keeps a monotonically increasing version and the last `max_length` row
+    changes of a dataframe. Every write operation bumps the version once and
+    records one entry per affected index key.
+
+    Each journal gets a random `epoch` when created. Versions are only
+    comparable within the same epoch, so clients that synced against another
+    journal (another process, or one that was restarted) are asked to resync.
+
+    Instances are meant to be set as a class attribute of a view, so they are
+    shared by all the requests handled by that view in the same process.
+    """
+    INSERT = 'insert'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+    def __init__(self, max_length=1000):
+        assert max_length > 0, '`max_length` must be a positive integer.'
+        self.max_length = max_length
+        self.epoch = uuid4().hex
+        self.version = 0
+        self._entries = deque()
+        self._evicted_version = 0
+        self._lock = Lock()
+
+    def record(self, operation, keys):
+        """
+        Records that `operation` was applied to the rows with the given index
+        keys, and returns the new version.
+        """
+        with self._lock:
+            self.version += 1
+            for key in keys:
+                if len(self._entries) == self.max_length:
+                    self._evicted_version = self._entries.popleft()[0]
+                self._entries.append((self.version, operation, key))
+            return self.version
+
+    def changes_since(self, epoch, since):
+        """
+        Returns the keys of the rows upserted (inserted or updated) and deleted
+        after version `since` of `epoch`, in the order of their last change.
+        Only the last operation on each key is taken into account. If `epoch`
+        is not the journal's, the journal no longer holds every change made
+        after `since`, or `since` is ahead of the current version,
+        `full_resync` is set and no keys are returned.
+        """
+        with self._lock:
+            if (epoch != self.epoch or since < self._evicted_version or
+                    since > self.version):
+                return DataFrameChanges(self.epoch, self.version, True, [], [])
+
+            recent_entries = []
+            for entry in reversed(self._entries):
+                if entry[0] <= since:
+                    break
+                recent_entries.append(entry)
+
+            last_operations = OrderedDict()
+            for version, operation, key in reversed(recent_entries):
+                last_operations.pop(key, None)
+                last_operations[key] = operation
+
+            upserted = [key for key, operation in last_operations.items()
+                        if operation != self.DELETE]
+            deleted = [key for key, operation in last_operations.items()
+                       if operation == self.DELETE]
+            return DataFrameChanges(self.epoch, self.version, False, upserted, deleted)
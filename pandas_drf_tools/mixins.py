@@ -6,10 +6,23 @@ which allows mixin classes to be composed in interesting ways.
 """
 from __future__ import unicode_literals
 
+from collections import OrderedDict
+
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
+from pandas_drf_tools.journal import DataFrameChangeJournal
+
+try:
+    from rest_framework.decorators import action
+
+    def list_route(**kwargs):
+        return action(detail=False, **kwargs)
+except ImportError:  # pragma: no cover
+    from rest_framework.decorators import list_route
+
 
 class CreateDataFrameMixin(object):
     """
@@ -24,7 +37,9 @@ class CreateDataFrameMixin(object):
 
     def perform_create(self, serializer):
         dataframe = self.get_dataframe()
-        return self.update_dataframe(dataframe.append(serializer.validated_data))
+        dataframe = self.update_dataframe(dataframe.append(serializer.validated_data))
+        self.record_dataframe_change(DataFrameChangeJournal.INSERT, serializer.validated_data.index)
+        return dataframe
 
     def get_success_headers(self, data):
         try:
@@ -59,6 +74,17 @@ class RetrieveDataFrameMixin(object):
         return Response(serializer.data)
 
 
+class RetrieveMultipleDataFrameMixin(object):
+    """
+    Retrieve several dataframe rows at once.
+    """
+    @list_route(methods=['get', 'post'], url_path='multiple')
+    def retrieve_multiple(self, request, *args, **kwargs):
+        instance = self.get_objects()
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+
 class UpdateDataFrameMixin(object):
     """
     Update a dataframe row.
@@ -76,7 +102,9 @@ class UpdateDataFrameMixin(object):
         instance.ix[validated_data.index, validated_data.columns] = validated_data[:]
         dataframe = self.get_dataframe()
         dataframe.ix[instance.index] = instance
-        return self.update_dataframe(dataframe)
+        dataframe = self.update_dataframe(dataframe)
+        self.record_dataframe_change(DataFrameChangeJournal.UPDATE, instance.index)
+        return dataframe
 
     def partial_update(self, request, *args, **kwargs):
         kwargs['partial'] = True
@@ -94,4 +122,63 @@ class DestroyDataFrameMixin(object):
 
     def perform_destroy(self, instance):
         dataframe = self.get_dataframe()
-        return self.update_dataframe(dataframe.drop(instance.index))
+        dataframe = self.update_dataframe(dataframe.drop(instance.index))
+        self.record_dataframe_change(DataFrameChangeJournal.DELETE, instance.index)
+        return dataframe
+
+
+class ChangesDataFrameMixin(object):
+    """
+    List the dataframe rows changed since a given version, passed as
+    `<epoch>:<version>`. Without a version, only the current one is returned,
+    so clients can start syncing. Requires the view to have a change journal.
+    """
+    @list_route(methods=['get'])
+    def changes(self, request, *args, **kwargs):
+        journal = self.get_change_journal()
+        assert journal is not None, (
+            "'%s' should either include a `change_journal` attribute, "
+            "or override the `get_change_journal()` method."
+            % self.__class__.__name__
+        )
+
+        value = request.query_params.get(self.changes_since_query_param)
+        if not value:
+            return Response(OrderedDict([
+                ('epoch', journal.epoch),
+                ('version', journal.version),
+                ('full_resync', True)
+            ]))
+
+        try:
+            epoch, since = value.split(':', 1)
+            since = int(since)
+        except ValueError:
+            raise ValidationError({
+                self.changes_since_query_param: ['Expected a value like `<epoch>:<version>`.']
+            })
+
+        changes = journal.changes_since(epoch, since)
+        if changes.full_resync:
+            return Response(OrderedDict([
+                ('epoch', changes.epoch),
+                ('version', changes.version),
+                ('full_resync', True)
+            ]), status=status.HTTP_410_GONE)
+
+        dataframe = self.filter_dataframe(self.get_dataframe())
+        upserted = dataframe.take(self.get_index_positions(dataframe, changes.upserted))
+        serializer = self.get_serializer(upserted)
+
+        # Rows that are no longer visible through the view (eg. filtered out
+        # after an update) have to be dropped by the client too.
+        deleted = changes.deleted + [key for key in changes.upserted
+                                     if key not in dataframe.index]
+
+        return Response(OrderedDict([
+            ('epoch', changes.epoch),
+            ('version', changes.version),
+            ('full_resync', False),
+            ('upserted', serializer.data),
+            ('deleted', deleted)
+        ]))
@@ -1,6 +1,7 @@
 from rest_framework.viewsets import ViewSetMixin
 
 from pandas_drf_tools import generics, mixins
+from pandas_drf_tools.mixins import list_route
 
 
 class GenericDataFrameViewSet(ViewSetMixin, generics.GenericDataFrameAPIView):
@@ -13,22 +14,28 @@ class GenericDataFrameViewSet(ViewSetMixin, generics.GenericDataFrameAPIView):
 
 
 class ReadOnlyDataFrameViewSet(mixins.RetrieveDataFrameMixin,
+                               mixins.RetrieveMultipleDataFrameMixin,
                                mixins.ListDataFrameMixin,
                                GenericDataFrameViewSet):
     """
-    A viewset that provides default `list()` and `retrieve()` actions.
+    A viewset that provides default `list()`, `retrieve()` and
+    `retrieve_multiple()` actions.
     """
-    pass
+    @list_route(methods=['get'], url_path='multiple')
+    def retrieve_multiple(self, request, *args, **kwargs):
+        return super().retrieve_multiple(request, *args, **kwargs)
 
 
 class DataFrameViewSet(mixins.CreateDataFrameMixin,
                        mixins.RetrieveDataFrameMixin,
+                       mixins.RetrieveMultipleDataFrameMixin,
                        mixins.UpdateDataFrameMixin,
                        mixins.DestroyDataFrameMixin,
                        mixins.ListDataFrameMixin,
                        GenericDataFrameViewSet):
     """
-    A viewset that provides default `create()`, `retrieve()`, `update()`,
-    `partial_update()`, `destroy()` and `list()` actions.
+    A viewset that provides default `create()`, `retrieve()`,
+    `retrieve_multiple()`, `update()`, `partial_update()`, `destroy()` and
+    `list()` actions.
     """
     pass
@@ -0,0 +1,20 @@
+import django
+
+from django.conf import settings
+
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'rest_framework',
+        ],
+        DATABASES={},
+        REST_FRAMEWORK={
+            'DEFAULT_AUTHENTICATION_CLASSES': [],
+            'DEFAULT_PERMISSION_CLASSES': [],
+            'UNAUTHENTICATED_USER': None,
+        },
+    )
+    django.setup()
@@ -0,0 +1,108 @@
+from unittest import TestCase
+
+from pandas_drf_tools.journal import DataFrameChangeJournal
+
+
+class DataFrameChangeJournalTestCase(TestCase):
+    def setUp(self):
+        self.journal = DataFrameChangeJournal(max_length=3)
+
+    def test_initial_state(self):
+        changes = self.journal.changes_since(self.journal.epoch, 0)
+
+        self.assertEqual(changes.version, 0)
+        self.assertFalse(changes.full_resync)
+        self.assertEqual(changes.upserted, [])
+        self.assertEqual(changes.deleted, [])
+
+    def test_record_bumps_version_once_per_write(self):
+        self.assertEqual(self.journal.record(DataFrameChangeJournal.INSERT, [1, 2]), 1)
+        self.assertEqual(self.journal.record(DataFrameChangeJournal.UPDATE, [1]), 2)
+        self.assertEqual(self.journal.version, 2)
+
+    def test_changes_since(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1])
+        self.journal.record(DataFrameChangeJournal.INSERT, [2])
+        self.journal.record(DataFrameChangeJournal.DELETE, [3])
+
+        changes = self.journal.changes_since(self.journal.epoch, 1)
+
+        self.assertEqual(changes.version, 3)
+        self.assertFalse(changes.full_resync)
+        self.assertEqual(changes.upserted, [2])
+        self.assertEqual(changes.deleted, [3])
+
+    def test_changes_in_change_order(self):
+        journal = DataFrameChangeJournal()
+        for key in (50, 60, 70):
+            journal.record(DataFrameChangeJournal.INSERT, [key])
+        journal.record(DataFrameChangeJournal.UPDATE, [50])
+
+        changes = journal.changes_since(journal.epoch, 0)
+
+        self.assertEqual(changes.upserted, [60, 70, 50])
+
+    def test_delete_then_insert(self):
+        self.journal.record(DataFrameChangeJournal.DELETE, [1])
+        self.journal.record(DataFrameChangeJournal.INSERT, [1])
+
+        changes = self.journal.changes_since(self.journal.epoch, 0)
+
+        self.assertEqual(changes.upserted, [1])
+        self.assertEqual(changes.deleted, [])
+
+    def test_insert_then_delete(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1])
+        self.journal.record(DataFrameChangeJournal.DELETE, [1])
+
+        changes = self.journal.changes_since(self.journal.epoch, 0)
+
+        self.assertEqual(changes.upserted, [])
+        self.assertEqual(changes.deleted, [1])
+
+    def test_since_evicted_version(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1, 2])
+        self.journal.record(DataFrameChangeJournal.UPDATE, [3, 4])
+
+        changes = self.journal.changes_since(self.journal.epoch, 1)
+
+        self.assertFalse(changes.full_resync)
+        self.assertEqual(changes.upserted, [3, 4])
+
+    def test_since_before_evicted_version(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1, 2])
+        self.journal.record(DataFrameChangeJournal.UPDATE, [3, 4])
+
+        changes = self.journal.changes_since(self.journal.epoch, 0)
+
+        self.assertTrue(changes.full_resync)
+        self.assertEqual(changes.version, 2)
+        self.assertEqual(changes.upserted, [])
+        self.assertEqual(changes.deleted, [])
+
+    def test_write_larger_than_max_length(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1])
+        self.journal.record(DataFrameChangeJournal.INSERT, [2, 3, 4, 5])
+
+        self.assertTrue(self.journal.changes_since(self.journal.epoch, 1).full_resync)
+
+        changes = self.journal.changes_since(self.journal.epoch, 2)
+        self.assertFalse(changes.full_resync)
+        self.assertEqual(changes.upserted, [])
+
+    def test_since_newer_than_version(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1])
+
+        changes = self.journal.changes_since(self.journal.epoch, 2)
+
+        self.assertTrue(changes.full_resync)
+        self.assertEqual(changes.version, 1)
+
+    def test_wrong_epoch(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1])
+
+        changes = self.journal.changes_since(DataFrameChangeJournal().epoch, 0)
+
+        self.assertTrue(changes.full_resync)
+        self.assertEqual(changes.epoch, self.journal.epoch)
+        self.assertEqual(changes.upserted, [])
@@ -0,0 +1,249 @@
+from unittest import TestCase, skipUnless
+
+import pandas as pd
+
+from rest_framework.routers import SimpleRouter
+from rest_framework.test import APIRequestFactory
+
+from pandas_drf_tools.journal import DataFrameChangeJournal
+from pandas_drf_tools.mixins import ChangesDataFrameMixin
+from pandas_drf_tools.serializers import DataFrameRecordsSerializer
+from pandas_drf_tools.viewsets import DataFrameViewSet, ReadOnlyDataFrameViewSet
+
+
+def get_view(viewset, url_name):
+    router = SimpleRouter()
+    router.register('test', viewset, 'test')
+    for url in router.urls:
+        if url.name == 'test-%s' % url_name:
+            return url.callback
+    raise AssertionError('No route named %s' % url_name)
+
+
+def get_index(data):
+    return [row[0] for row in data['data']]
+
+
+class ExampleDataFrameViewSet(DataFrameViewSet):
+    serializer_class = DataFrameRecordsSerializer
+    dataframe = pd.DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5], 'c': ['x', 'y', 'z']},
+                             index=[1, 2, 3])
+
+
+class ExampleReadOnlyDataFrameViewSet(ReadOnlyDataFrameViewSet):
+    serializer_class = DataFrameRecordsSerializer
+    dataframe = ExampleDataFrameViewSet.dataframe
+
+
+class ExampleStringIndexDataFrameViewSet(DataFrameViewSet):
+    serializer_class = DataFrameRecordsSerializer
+    dataframe = pd.DataFrame({'a': [1, 2]}, index=['1', '2'])
+
+
+class ExampleChangesDataFrameViewSet(ChangesDataFrameMixin, DataFrameViewSet):
+    serializer_class = DataFrameRecordsSerializer
+
+    def update_dataframe(self, dataframe):
+        type(self).dataframe = dataframe
+        return dataframe
+
+    def filter_dataframe(self, dataframe):
+        return dataframe[dataframe['a'] >= 0]
+
+
+class RetrieveTestCase(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def test_retrieve_keeps_dtypes(self):
+        view = ExampleDataFrameViewSet(action_map={'get': 'retrieve'}, kwargs={'index': '2'},
+                                       format_kwarg=None)
+        view.request = view.initialize_request(self.factory.get('/test/2/'))
+
+        row = view.get_object()
+
+        self.assertEqual(list(row.index), [2])
+        self.assertEqual(row.dtypes.tolist(), ExampleDataFrameViewSet.dataframe.dtypes.tolist())
+
+    def test_retrieve_coerces_key(self):
+        view = get_view(ExampleDataFrameViewSet, 'detail')
+        response = view(self.factory.get('/test/3/'), index='3')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data'], [(3, 3, 3.5, 'z')])
+
+    def test_retrieve_missing_key(self):
+        view = get_view(ExampleDataFrameViewSet, 'detail')
+        response = view(self.factory.get('/test/4/'), index='4')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_retrieve_non_numeric_key(self):
+        view = get_view(ExampleDataFrameViewSet, 'detail')
+        response = view(self.factory.get('/test/abc/'), index='abc')
+
+        self.assertEqual(response.status_code, 404)
+
+
+class RetrieveMultipleTestCase(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = get_view(ExampleDataFrameViewSet, 'retrieve-multiple')
+
+    def test_query_param(self):
+        response = self.view(self.factory.get('/test/multiple/', {'ids': '3,1'}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_index(response.data), [3, 1])
+
+    def test_query_param_missing_and_repeated_keys(self):
+        response = self.view(self.factory.get('/test/multiple/', {'ids': '2,4,2,1'}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_index(response.data), [2, 1])
+
+    def test_query_param_empty(self):
+        response = self.view(self.factory.get('/test/multiple/'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_index(response.data), [])
+
+    def test_query_param_non_numeric_key(self):
+        response = self.view(self.factory.get('/test/multiple/', {'ids': '1,abc'}))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ids', response.data)
+
+    def test_post_list(self):
+        response = self.view(self.factory.post('/test/multiple/', [2, 3], format='json'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_index(response.data), [2, 3])
+
+    def test_post_dict(self):
+        response = self.view(self.factory.post('/test/multiple/', {'ids': ['1', 3]},
+                                               format='json'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_index(response.data), [1, 3])
+
+    def test_post_dict_not_a_list(self):
+        response = self.view(self.factory.post('/test/multiple/', {'ids': 1}, format='json'))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ids', response.data)
+
+    def test_post_string_index(self):
+        view = get_view(ExampleStringIndexDataFrameViewSet, 'retrieve-multiple')
+        response = view(self.factory.post('/test/multiple/', [1], format='json'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_index(response.data), ['1'])
+
+    def test_read_only_get(self):
+        view = get_view(ExampleReadOnlyDataFrameViewSet, 'retrieve-multiple')
+        response = view(self.factory.get('/test/multiple/', {'ids': '1'}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_index(response.data), [1])
+
+    def test_read_only_post(self):
+        view = get_view(ExampleReadOnlyDataFrameViewSet, 'retrieve-multiple')
+        response = view(self.factory.post('/test/multiple/', [1], format='json'))
+
+        self.assertEqual(response.status_code, 405)
+
+
+class ChangesTestCase(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = get_view(ExampleChangesDataFrameViewSet, 'changes')
+        self.journal = DataFrameChangeJournal()
+        ExampleChangesDataFrameViewSet.change_journal = self.journal
+        ExampleChangesDataFrameViewSet.dataframe = pd.DataFrame({'a': [1, 2, 3]},
+                                                                index=[1, 2, 3])
+
+    def get_changes(self, since=None):
+        params = {} if since is None else {'since': since}
+        return self.view(self.factory.get('/test/changes/', params))
+
+    def test_without_since(self):
+        self.journal.record(DataFrameChangeJournal.INSERT, [1])
+
+        for since in (None, ''):
+            response = self.get_changes(since)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data, {'epoch': self.journal.epoch, 'version': 1,
+                                             'full_resync': True})
+
+    def test_invalid_since(self):
+        for since in ('1', '%s:abc' % self.journal.epoch):
+            response = self.get_changes(since)
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('since', response.data)
+
+    def test_wrong_epoch(self):
+        response = self.get_changes('%s:0' % DataFrameChangeJournal().epoch)
+
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(response.data, {'epoch': self.journal.epoch, 'version': 0,
+                                         'full_resync': True})
+
+    def test_since_newer_than_version(self):
+        response = self.get_changes('%s:1' % self.journal.epoch)
+
+        self.assertEqual(response.status_code, 410)
+        self.assertTrue(response.data['full_resync'])
+
+    def test_changes(self):
+        self.journal.record(DataFrameChangeJournal.UPDATE, [3])
+        self.journal.record(DataFrameChangeJournal.UPDATE, [1])
+        self.journal.record(DataFrameChangeJournal.DELETE, [4])
+
+        response = self.get_changes('%s:0' % self.journal.epoch)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['version'], 3)
+        self.assertFalse(response.data['full_resync'])
+        self.assertEqual(get_index(response.data['upserted']), [3, 1])
+        self.assertEqual(response.data['deleted'], [4])
+
+    def test_filtered_out_rows_are_deleted(self):
+        ExampleChangesDataFrameViewSet.dataframe.loc[2, 'a'] = -1
+        self.journal.record(DataFrameChangeJournal.UPDATE, [2, 3])
+
+        response = self.get_changes('%s:0' % self.journal.epoch)
+
+        self.assertEqual(get_index(response.data['upserted']), [3])
+        self.assertEqual(response.data['deleted'], [2])
+
+    @skipUnless(hasattr(pd.DataFrame, 'append'), 'DataFrame.append is not available')
+    def test_create_records_change(self):
+        view = get_view(ExampleChangesDataFrameViewSet, 'list')
+        response = view(self.factory.post('/test/', {'columns': ['index', 'a'], 'data': [[4, 4]]},
+                                          format='json'))
+
+        self.assertEqual(response.status_code, 201)
+        changes = self.journal.changes_since(self.journal.epoch, 0)
+        self.assertEqual(changes.upserted, [4])
+
+    @skipUnless(hasattr(pd.DataFrame, 'ix'), 'DataFrame.ix is not available')
+    def test_update_records_change(self):
+        view = get_view(ExampleChangesDataFrameViewSet, 'detail')
+        response = view(self.factory.put('/test/2/', {'columns': ['index', 'a'], 'data': [[2, 5]]},
+                                         format='json'), index='2')
+
+        self.assertEqual(response.status_code, 200)
+        changes = self.journal.changes_since(self.journal.epoch, 0)
+        self.assertEqual(changes.upserted, [2])
+
+    def test_destroy_records_change(self):
+        view = get_view(ExampleChangesDataFrameViewSet, 'detail')
+        response = view(self.factory.delete('/test/2/'), index='2')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(list(ExampleChangesDataFrameViewSet.dataframe.index), [1, 3])
+        changes = self.journal.changes_since(self.journal.epoch, 0)
+        self.assertEqual(changes.deleted, [2])